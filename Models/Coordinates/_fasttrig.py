@@ -0,0 +1,68 @@
+from __future__ import annotations
+import math
+
+"""
+Scalar trig helpers shared by the coordinate classes: a sin/cos pair
+helper and branchy angle normalization tuned for small per-step deltas.
+
+An earlier revision also carried opt-in polynomial approximations of
+sin/cos/atan2/acos behind a `use_fast_trig` flag. Interpreter dispatch
+per multiply made every one of them several times slower than the libm
+call it replaced — the cycle-count argument for minimax polynomials only
+holds in compiled code — so the flag and the polynomials were removed.
+Approximate trig belongs inside the numba kernels, where there is no
+per-operation overhead.
+"""
+
+_TWO_PI = 2 * math.pi
+
+
+def _math_sincos(x: float) -> tuple[float, float]:
+    return math.sin(x), math.cos(x)
+
+
+sincos = _math_sincos
+"""
+Exact sin/cos of the same angle in one call. This is a plain math.sin /
+math.cos pair: an earlier ctypes binding of glibc's fused sincos turned
+out ~20x slower per call than the pair (FFI dispatch plus two c_double
+allocations dwarf the saved libm call). A native sincos only pays inside
+compiled kernels, where there is no per-call FFI cost.
+"""
+
+
+def wrap_pi(value: float) -> float:
+    """
+    Normalize an angle to [0, pi) without fmod. Per-step deltas are small,
+    so a single compare-and-add almost always suffices; values further out
+    of range fall back to %.
+    :param value: angle in radians
+    :return: the angle wrapped into [0, pi)
+    """
+    if value >= math.pi:
+        value -= math.pi
+        if value >= math.pi:
+            return value % math.pi
+    elif value < 0.0:
+        value += math.pi
+        if value < 0.0:
+            return value % math.pi
+    return value
+
+
+def wrap_two_pi(value: float) -> float:
+    """
+    Normalize an angle to [0, 2*pi) without fmod, falling back to % for
+    values more than one period out of range.
+    :param value: angle in radians
+    :return: the angle wrapped into [0, 2*pi)
+    """
+    if value >= _TWO_PI:
+        value -= _TWO_PI
+        if value >= _TWO_PI:
+            return value % _TWO_PI
+    elif value < 0.0:
+        value += _TWO_PI
+        if value < 0.0:
+            return value % _TWO_PI
+    return value
@@ -0,0 +1,266 @@
+from __future__ import annotations
+import math
+
+import numpy as np
+from numba import get_num_threads, get_thread_id, njit, prange
+
+
+_TWO_PI = 2 * math.pi
+
+# Eager signatures, ahead-of-time style: with the dtypes pinned the
+# kernels compile when the module is first imported and land in the
+# on-disk cache, so later processes load native code immediately instead
+# of paying a JIT warmup on the first update. One variant per supported
+# state dtype (ages and the Cartesian accelerations stay float64 either
+# way).
+_KICK_SIGS = [
+    "(f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8[::1],"
+    " f8[::1], f8[::1], f8[::1], f8)",
+    "(f4[::1], f4[::1], f4[::1], f4[::1], f4[::1], f4[::1],"
+    " f8[::1], f8[::1], f8[::1], f8)",
+]
+
+_KICK_DRIFT_SIGS = [
+    "(f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8[::1],"
+    " f8[::1], f8[::1], f8[::1], f8, f8)",
+    "(f4[::1], f4[::1], f4[::1], f4[::1], f4[::1], f4[::1], f8[::1],"
+    " f8[::1], f8[::1], f8[::1], f8, f8)",
+]
+
+
+@njit(cache=True, fastmath=True)
+def _kicked_velocity(r_i, theta_i, phi_i, v_r_i, v_theta_i, v_phi_i,
+                     ax_i, ay_i, az_i, dt):
+    """
+    One element's spherical velocity after a Cartesian kick a * dt:
+    convert to Cartesian, kick, convert back at the same position. The
+    origin and pole guards mirror SphericalVelocity.from_cartesian.
+    :return: (v_r, v_theta, v_phi) after the kick
+    """
+    sin_theta = math.sin(theta_i)
+    cos_theta = math.cos(theta_i)
+    sin_phi = math.sin(phi_i)
+    cos_phi = math.cos(phi_i)
+
+    r_v_theta = r_i * v_theta_i
+    r_sin_theta_v_phi = r_i * sin_theta * v_phi_i
+    vx = (v_r_i * sin_theta * cos_phi + r_v_theta * cos_theta * cos_phi -
+          r_sin_theta_v_phi * sin_phi)
+    vy = (v_r_i * sin_theta * sin_phi + r_v_theta * cos_theta * sin_phi +
+          r_sin_theta_v_phi * cos_phi)
+    vz = v_r_i * cos_theta - r_v_theta * sin_theta
+
+    vx += ax_i * dt
+    vy += ay_i * dt
+    vz += az_i * dt
+
+    if r_i > 0.0:
+        new_v_r = vx * sin_theta * cos_phi + vy * sin_theta * sin_phi + vz * cos_theta
+        new_v_theta = (vx * cos_theta * cos_phi + vy * cos_theta * sin_phi -
+                       vz * sin_theta) / r_i
+        denom = r_i * sin_theta
+        new_v_phi = (-vx * sin_phi + vy * cos_phi) / denom if denom != 0.0 else 0.0
+    else:
+        # At the origin, velocity is purely radial in the direction of motion
+        new_v_r = math.sqrt(vx * vx + vy * vy + vz * vz)
+        new_v_theta = 0.0
+        new_v_phi = 0.0
+    return new_v_r, new_v_theta, new_v_phi
+
+
+@njit(_KICK_SIGS, cache=True, fastmath=True, parallel=True)
+def kick_velocities(r, theta, phi, v_r, v_theta, v_phi, ax, ay, az, dt):
+    """
+    Apply Cartesian accelerations to every element's spherical velocity
+    for one kick interval, in place, in a single compiled parallel pass
+    (the conversion to Cartesian and back happens per element in
+    registers instead of as whole-array ufunc sweeps).
+
+    :param r: radial coordinates, shape (N,)
+    :param theta: polar angles, shape (N,)
+    :param phi: azimuthal angles, shape (N,)
+    :param v_r: radial velocities, shape (N,), updated in place
+    :param v_theta: polar angular velocities, shape (N,), updated in place
+    :param v_phi: azimuthal angular velocities, shape (N,), updated in place
+    :param ax: Cartesian x accelerations, shape (N,)
+    :param ay: Cartesian y accelerations, shape (N,)
+    :param az: Cartesian z accelerations, shape (N,)
+    :param dt: the kick interval in seconds
+    """
+    n = r.shape[0]
+    for i in prange(n):
+        v_r[i], v_theta[i], v_phi[i] = _kicked_velocity(
+            r[i], theta[i], phi[i], v_r[i], v_theta[i], v_phi[i],
+            ax[i], ay[i], az[i], dt)
+
+
+@njit(_KICK_DRIFT_SIGS, cache=True, fastmath=True, parallel=True)
+def kick_drift(r, theta, phi, v_r, v_theta, v_phi, ages, ax, ay, az,
+               kick_dt, dt):
+    """
+    Fused half-kick plus drift, done entirely in Cartesian: each
+    element's position and velocity are converted to Cartesian in
+    registers, the velocity is kicked by a * kick_dt, the position
+    drifts by v * dt along a straight line, and both are converted back
+    to spherical storage at the new position. Drifting the Cartesian
+    coordinates keeps force-free motion exact — advancing r/theta/phi
+    at constant rates instead would curve straight trajectories around
+    the origin and pull close orbits inward — and makes the
+    kick-drift-kick composition in SpaceTime.update genuine velocity
+    Verlet. Still one pass over the arrays, which is what matters once
+    the step is memory-bound.
+
+    Parameters are as in kick_velocities, plus ages (updated in place);
+    kick_dt is the kick interval (half the step for velocity Verlet)
+    and dt the drift interval.
+    """
+    n = r.shape[0]
+    for i in prange(n):
+        r_i = r[i]
+        sin_theta = math.sin(theta[i])
+        cos_theta = math.cos(theta[i])
+        sin_phi = math.sin(phi[i])
+        cos_phi = math.cos(phi[i])
+
+        rho = r_i * sin_theta
+        x = rho * cos_phi
+        y = rho * sin_phi
+        z = r_i * cos_theta
+
+        r_v_theta = r_i * v_theta[i]
+        rho_v_phi = rho * v_phi[i]
+        vx = (v_r[i] * sin_theta * cos_phi + r_v_theta * cos_theta * cos_phi -
+              rho_v_phi * sin_phi)
+        vy = (v_r[i] * sin_theta * sin_phi + r_v_theta * cos_theta * sin_phi +
+              rho_v_phi * cos_phi)
+        vz = v_r[i] * cos_theta - r_v_theta * sin_theta
+
+        vx += ax[i] * kick_dt
+        vy += ay[i] * kick_dt
+        vz += az[i] * kick_dt
+        x += vx * dt
+        y += vy * dt
+        z += vz * dt
+
+        new_rho_sq = x * x + y * y
+        new_r = math.sqrt(new_rho_sq + z * z)
+        if new_r > 0.0:
+            # The spherical basis at the new position falls straight out
+            # of the Cartesian components — no sincos round trip
+            new_rho = math.sqrt(new_rho_sq)
+            sin_theta = new_rho / new_r
+            cos_theta = min(1.0, max(-1.0, z / new_r))
+            if new_rho > 0.0:
+                sin_phi = y / new_rho
+                cos_phi = x / new_rho
+                p = math.atan2(y, x)
+                if p < 0.0:
+                    p += _TWO_PI
+            else:
+                sin_phi = 0.0
+                cos_phi = 1.0
+                p = 0.0
+            r[i] = new_r
+            theta[i] = math.acos(cos_theta)
+            phi[i] = p
+
+            v_r[i] = (vx * sin_theta * cos_phi + vy * sin_theta * sin_phi +
+                      vz * cos_theta)
+            v_theta[i] = (vx * cos_theta * cos_phi + vy * cos_theta * sin_phi -
+                          vz * sin_theta) / new_r
+            denom = new_r * sin_theta
+            v_phi[i] = (-vx * sin_phi + vy * cos_phi) / denom if denom != 0.0 else 0.0
+        else:
+            # At the origin, velocity is purely radial in the direction of motion
+            r[i] = 0.0
+            theta[i] = 0.0
+            phi[i] = 0.0
+            v_r[i] = math.sqrt(vx * vx + vy * vy + vz * vz)
+            v_theta[i] = 0.0
+            v_phi[i] = 0.0
+
+        ages[i] += dt
+
+
+# No cache=True here: get_thread_id compiles against dynamic globals that
+# the on-disk cache cannot serialize (finalize() warms it instead)
+@njit(fastmath=True, parallel=True, error_model="numpy")
+def gravity_forces(x, y, z, m, G, Fx, Fy, Fz, potentials):
+    """
+    Accumulate every element's net gravitational force and potential from
+    Cartesian positions, in place.
+
+    The pair sum runs as a compiled double loop over unordered pairs
+    (i, j) with j > i, applying each evaluation to both members (Newton's
+    third law), so only N(N-1)/2 interactions are computed. prange spreads
+    the outer rows across cores; each thread scatters its contributions
+    into a private partial buffer that is reduced afterwards, avoiding any
+    race on the shared output rows. fastmath lets LLVM fuse the
+    dx/dy/dz/inv_r3 chain into FMA SIMD lanes.
+
+    :param x: Cartesian x positions, shape (N,)
+    :param y: Cartesian y positions, shape (N,)
+    :param z: Cartesian z positions, shape (N,)
+    :param m: masses in kg, shape (N,)
+    :param G: the gravitational constant
+    :param Fx: output net force x components, shape (N,)
+    :param Fy: output net force y components, shape (N,)
+    :param Fz: output net force z components, shape (N,)
+    :param potentials: output gravitational potentials, shape (N,)
+    """
+    n = x.shape[0]
+    n_threads = get_num_threads()
+    # Per-thread partial sums: force xyz plus potential, per element
+    partial = np.zeros((n_threads, 4, n))
+
+    for i in prange(n):
+        local = partial[get_thread_id()]
+        xi = x[i]
+        yi = y[i]
+        zi = z[i]
+        mi = m[i]
+        fx = 0.0
+        fy = 0.0
+        fz = 0.0
+        pot = 0.0
+        for j in range(i + 1, n):
+            dx = x[j] - xi
+            dy = y[j] - yi
+            dz = z[j] - zi
+            r2 = dx * dx + dy * dy + dz * dz
+            # Coincident pairs contribute nothing
+            if r2 > 0.0:
+                inv_r = 1.0 / math.sqrt(r2)
+                inv_r3 = inv_r / r2
+                mj = m[j]
+                f = mi * mj * inv_r3
+                fjx = f * dx
+                fjy = f * dy
+                fjz = f * dz
+                fx += fjx
+                fy += fjy
+                fz += fjz
+                pot += mj * inv_r
+                local[0, j] -= fjx
+                local[1, j] -= fjy
+                local[2, j] -= fjz
+                local[3, j] += mi * inv_r
+        local[0, i] += fx
+        local[1, i] += fy
+        local[2, i] += fz
+        local[3, i] += pot
+
+    for i in prange(n):
+        sfx = 0.0
+        sfy = 0.0
+        sfz = 0.0
+        spot = 0.0
+        for t in range(n_threads):
+            sfx += partial[t, 0, i]
+            sfy += partial[t, 1, i]
+            sfz += partial[t, 2, i]
+            spot += partial[t, 3, i]
+        Fx[i] = G * sfx
+        Fy[i] = G * sfy
+        Fz[i] = G * sfz
+        potentials[i] = -G * spot
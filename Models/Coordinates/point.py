@@ -8,6 +8,8 @@ class Point(ABC):
     Defines the interface for both Cartesian and spherical coordinate access.
     """
 
+    __slots__ = ()
+
     # Cartesian coordinate properties (required for all point types)
     @property
     @abstractmethod
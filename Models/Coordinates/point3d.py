@@ -2,6 +2,7 @@ from __future__ import annotations
 import math
 
 from .point import Point
+from ._fasttrig import sincos
 
 
 class Point3D(Point):
@@ -13,6 +14,8 @@ class Point3D(Point):
     For spherical-primary storage, use SphericalPoint instead.
     """
 
+    __slots__ = ("_x", "_y", "_z")
+
     def __init__(self, x: float, y: float, z: float):
         """
         Initialize a Point3D from Cartesian coordinates.
@@ -37,7 +40,7 @@ class Point3D(Point):
     @staticmethod
     def _cartesian_to_spherical(x: float, y: float, z: float) -> tuple[float, float, float]:
         """Convert Cartesian (x, y, z) to spherical (r, theta, phi)."""
-        r = math.sqrt(x**2 + y**2 + z**2)
+        r = math.hypot(x, y, z)
         if r == 0:
             return 0.0, 0.0, 0.0
         theta = math.acos(z / r)  # polar angle
@@ -73,7 +76,7 @@ class Point3D(Point):
     @property
     def r(self) -> float:
         """Radial distance from origin."""
-        return math.sqrt(self._x**2 + self._y**2 + self._z**2)
+        return math.hypot(self._x, self._y, self._z)
 
     @r.setter
     def r(self, value: float):
@@ -98,13 +101,21 @@ class Point3D(Point):
 
     @theta.setter
     def theta(self, value: float):
-        r = self.r
-        phi = self.phi
+        # Compute r once instead of round-tripping through the properties,
+        # which each redo the sqrt/atan2 from scratch
+        r = math.hypot(self._x, self._y, self._z)
+        # sin/cos of phi fall straight out of x and y — no atan2-then-sincos
+        rho = math.hypot(self._x, self._y)
+        if rho == 0:
+            sin_phi, cos_phi = 0.0, 1.0
+        else:
+            cos_phi = self._x / rho
+            sin_phi = self._y / rho
         # Normalize theta to [0, π]
-        value = value % math.pi
-        self._x = r * math.sin(value) * math.cos(phi)
-        self._y = r * math.sin(value) * math.sin(phi)
-        self._z = r * math.cos(value)
+        sin_theta, cos_theta = sincos(value % math.pi)
+        self._x = r * sin_theta * cos_phi
+        self._y = r * sin_theta * sin_phi
+        self._z = r * cos_theta
 
     @property
     def phi(self) -> float:
@@ -113,22 +124,24 @@ class Point3D(Point):
 
     @phi.setter
     def phi(self, value: float):
-        r = self.r
-        theta = self.theta
+        r = math.hypot(self._x, self._y, self._z)
+        if r == 0:
+            return
+        # sin/cos of theta fall straight out of z/r — no acos round-trip
+        cos_theta = self._z / r
+        sin_theta = math.sqrt(max(0.0, 1.0 - cos_theta * cos_theta))
         # Normalize phi to [0, 2π)
-        value = value % (2 * math.pi)
-        self._x = r * math.sin(theta) * math.cos(value)
-        self._y = r * math.sin(theta) * math.sin(value)
-        self._z = r * math.cos(theta)
+        sin_phi, cos_phi = sincos(value % (2 * math.pi))
+        self._x = r * sin_theta * cos_phi
+        self._y = r * sin_theta * sin_phi
+        self._z = r * cos_theta
 
     def distance_to(self, other: "Point") -> float:
         """
         Calculate distance to another point using Cartesian coordinates.
         """
-        dx = other.x - self._x
-        dy = other.y - self._y
-        dz = other.z - self._z
-        return math.sqrt(dx**2 + dy**2 + dz**2)
+        return math.dist((self._x, self._y, self._z),
+                         (other.x, other.y, other.z))
 
     def direction_to(self, other: "Point") -> tuple[float, float]:
         """
@@ -139,7 +152,7 @@ class Point3D(Point):
         dy = other.y - self._y
         dz = other.z - self._z
 
-        dist = math.sqrt(dx**2 + dy**2 + dz**2)
+        dist = math.hypot(dx, dy, dz)
         if dist == 0:
             return 0.0, 0.0
 
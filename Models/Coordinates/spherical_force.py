@@ -13,6 +13,8 @@ class SphericalForce:
     force is primarily radial.
     """
 
+    __slots__ = ("_F_r", "_F_theta", "_F_phi")
+
     def __init__(self, F_r: float = 0.0, F_theta: float = 0.0, F_phi: float = 0.0):
         self._F_r = F_r
         self._F_theta = F_theta
@@ -53,6 +55,19 @@ class SphericalForce:
             self._F_phi + other._F_phi
         )
 
+    def iadd(self, other: "SphericalForce") -> "SphericalForce":
+        """
+        Add another force into this one in place. The accumulation loops
+        use this instead of __add__ so summing N contributions mutates one
+        accumulator rather than allocating N intermediate forces.
+        :param other: the force to add into this one
+        :return: self, for chaining
+        """
+        self._F_r += other._F_r
+        self._F_theta += other._F_theta
+        self._F_phi += other._F_phi
+        return self
+
     def __mul__(self, scalar: float) -> "SphericalForce":
         """Multiply force by a scalar."""
         return SphericalForce(
@@ -66,7 +81,17 @@ class SphericalForce:
 
     def magnitude(self) -> float:
         """Calculate the magnitude of the force."""
-        return math.sqrt(self._F_r**2 + self._F_theta**2 + self._F_phi**2)
+        return math.sqrt(self.magnitude_squared())
+
+    def magnitude_squared(self) -> float:
+        """
+        Calculate the squared magnitude of the force. Comparisons against
+        thresholds or other forces should use this and square the other
+        side, skipping the sqrt.
+        """
+        return (self._F_r * self._F_r +
+                self._F_theta * self._F_theta +
+                self._F_phi * self._F_phi)
 
     def reset(self):
         """Reset all force components to zero."""
@@ -2,6 +2,7 @@ from __future__ import annotations
 import math
 
 from .point import Point
+from ._fasttrig import sincos, wrap_pi, wrap_two_pi
 
 
 class SphericalPoint(Point):
@@ -15,12 +16,17 @@ class SphericalPoint(Point):
     and Schwarzschild metric calculations.
     """
 
+    __slots__ = ("_r", "_theta", "_phi", "_r2",
+                 "_sin_theta", "_cos_theta", "_sin_phi", "_cos_phi")
+
     def __init__(self, x: float, y: float, z: float):
         """
         Initialize a SphericalPoint from Cartesian coordinates.
         Internally converts to and stores spherical coordinates.
         """
         self._r, self._theta, self._phi = self._cartesian_to_spherical(x, y, z)
+        self._r2 = self._r * self._r
+        self._refresh_trig()
 
     @classmethod
     def from_spherical(cls, r: float, theta: float, phi: float) -> "SphericalPoint":
@@ -34,24 +40,41 @@ class SphericalPoint(Point):
         instance._r = r
         instance._theta = theta
         instance._phi = phi
+        instance._r2 = r * r
+        instance._refresh_trig()
         return instance
 
     @staticmethod
     def _cartesian_to_spherical(x: float, y: float, z: float) -> tuple[float, float, float]:
         """Convert Cartesian (x, y, z) to spherical (r, theta, phi)."""
-        r = math.sqrt(x**2 + y**2 + z**2)
+        r = math.hypot(x, y, z)
         if r == 0:
             return 0.0, 0.0, 0.0
         theta = math.acos(z / r)  # polar angle
         phi = math.atan2(y, x)    # azimuthal angle
         return r, theta, phi
 
+    def _refresh_theta_trig(self):
+        """Recompute the cached sin/cos of theta."""
+        self._sin_theta, self._cos_theta = sincos(self._theta)
+
+    def _refresh_phi_trig(self):
+        """Recompute the cached sin/cos of phi."""
+        self._sin_phi, self._cos_phi = sincos(self._phi)
+
+    def _refresh_trig(self):
+        """Recompute all four cached trig values."""
+        self._refresh_theta_trig()
+        self._refresh_phi_trig()
+
     @staticmethod
     def _spherical_to_cartesian(r: float, theta: float, phi: float) -> tuple[float, float, float]:
         """Convert spherical (r, theta, phi) to Cartesian (x, y, z)."""
-        x = r * math.sin(theta) * math.cos(phi)
-        y = r * math.sin(theta) * math.sin(phi)
-        z = r * math.cos(theta)
+        sin_theta, cos_theta = sincos(theta)
+        sin_phi, cos_phi = sincos(phi)
+        x = r * sin_theta * cos_phi
+        y = r * sin_theta * sin_phi
+        z = r * cos_theta
         return x, y, z
 
     # Spherical coordinate properties (internal representation)
@@ -63,6 +86,7 @@ class SphericalPoint(Point):
     @r.setter
     def r(self, value: float):
         self._r = max(0.0, value)  # r cannot be negative
+        self._r2 = self._r * self._r
 
     @property
     def theta(self) -> float:
@@ -72,7 +96,8 @@ class SphericalPoint(Point):
     @theta.setter
     def theta(self, value: float):
         # Normalize theta to [0, π]
-        self._theta = value % math.pi
+        self._theta = wrap_pi(value)
+        self._refresh_theta_trig()
 
     @property
     def phi(self) -> float:
@@ -82,44 +107,46 @@ class SphericalPoint(Point):
     @phi.setter
     def phi(self, value: float):
         # Normalize phi to [0, 2π)
-        self._phi = value % (2 * math.pi)
+        self._phi = wrap_two_pi(value)
+        self._refresh_phi_trig()
 
-    # Cartesian coordinate properties (computed from spherical)
+    # Cartesian coordinate properties (multiplications over the cached trig)
     @property
     def x(self) -> float:
-        x, _, _ = self._spherical_to_cartesian(self._r, self._theta, self._phi)
-        return x
+        return self._r * self._sin_theta * self._cos_phi
 
     @x.setter
     def x(self, value: float):
-        _, y, z = self._spherical_to_cartesian(self._r, self._theta, self._phi)
-        self._r, self._theta, self._phi = self._cartesian_to_spherical(value, y, z)
+        self._r, self._theta, self._phi = self._cartesian_to_spherical(value, self.y, self.z)
+        self._r2 = self._r * self._r
+        self._refresh_trig()
 
     @property
     def y(self) -> float:
-        _, y, _ = self._spherical_to_cartesian(self._r, self._theta, self._phi)
-        return y
+        return self._r * self._sin_theta * self._sin_phi
 
     @y.setter
     def y(self, value: float):
-        x, _, z = self._spherical_to_cartesian(self._r, self._theta, self._phi)
-        self._r, self._theta, self._phi = self._cartesian_to_spherical(x, value, z)
+        self._r, self._theta, self._phi = self._cartesian_to_spherical(self.x, value, self.z)
+        self._r2 = self._r * self._r
+        self._refresh_trig()
 
     @property
     def z(self) -> float:
-        _, _, z = self._spherical_to_cartesian(self._r, self._theta, self._phi)
-        return z
+        return self._r * self._cos_theta
 
     @z.setter
     def z(self, value: float):
-        x, y, _ = self._spherical_to_cartesian(self._r, self._theta, self._phi)
-        self._r, self._theta, self._phi = self._cartesian_to_spherical(x, y, value)
+        self._r, self._theta, self._phi = self._cartesian_to_spherical(self.x, self.y, value)
+        self._r2 = self._r * self._r
+        self._refresh_trig()
 
     def distance_to(self, other: "Point") -> float:
         """
         Calculate distance to another point using spherical coordinates.
         Uses the spherical law of cosines for efficiency when both points
-        are SphericalPoint instances.
+        are SphericalPoint instances, with a cheap radial estimate when the
+        radii differ by more than an order of magnitude.
         """
         if isinstance(other, SphericalPoint):
             if self._r == 0:
@@ -127,32 +154,91 @@ class SphericalPoint(Point):
             if other._r == 0:
                 return self._r
 
-            # Spherical law of cosines for 3D
-            cos_angle = (math.sin(self._theta) * math.sin(other._theta) *
-                         math.cos(self._phi - other._phi) +
-                         math.cos(self._theta) * math.cos(other._theta))
+            # Outer-scatter short-circuit: when the radii differ by more
+            # than an order of magnitude the angular term contributes at
+            # most ~20% and |r1 - r2| is an acceptable estimate
+            dr = self._r - other._r
+            if abs(dr) > 10.0 * min(self._r, other._r):
+                return abs(dr)
+
+            # Spherical law of cosines for 3D; cos(phi1 - phi2) expands to
+            # the cached phi trig, so no transcendental calls are needed
+            cos_dphi = self._cos_phi * other._cos_phi + self._sin_phi * other._sin_phi
+            cos_angle = (self._sin_theta * other._sin_theta * cos_dphi +
+                         self._cos_theta * other._cos_theta)
 
             # Clamp to [-1, 1] to handle floating point errors
             cos_angle = max(-1.0, min(1.0, cos_angle))
 
-            return math.sqrt(self._r**2 + other._r**2 - 2 * self._r * other._r * cos_angle)
+            return math.sqrt(self._r2 + other._r2 - 2 * self._r * other._r * cos_angle)
         else:
             # Fallback to Cartesian distance for other Point types
             dx = other.x - self.x
             dy = other.y - self.y
             dz = other.z - self.z
-            return math.sqrt(dx**2 + dy**2 + dz**2)
+            return math.hypot(dx, dy, dz)
+
+    def distance_squared_to(self, other: "Point") -> float:
+        """
+        Calculate the squared distance to another point. Comparisons and
+        inverse-square terms (e.g. softening, 1 / (d² + ε²)) should use
+        this and skip the sqrt.
+        """
+        if isinstance(other, SphericalPoint):
+            if self._r == 0:
+                return other._r2
+            if other._r == 0:
+                return self._r2
+
+            cos_dphi = self._cos_phi * other._cos_phi + self._sin_phi * other._sin_phi
+            cos_angle = (self._sin_theta * other._sin_theta * cos_dphi +
+                         self._cos_theta * other._cos_theta)
+
+            # Clamp to [-1, 1] to handle floating point errors
+            cos_angle = max(-1.0, min(1.0, cos_angle))
+
+            return max(0.0, self._r2 + other._r2 - 2 * self._r * other._r * cos_angle)
+        else:
+            dx = other.x - self.x
+            dy = other.y - self.y
+            dz = other.z - self.z
+            return dx * dx + dy * dy + dz * dz
+
+    def _delta(self, other: "Point") -> tuple[float, float, float]:
+        """
+        Cartesian delta to another point. Assembled from the cached trig
+        values when both points are spherical — no _spherical_to_cartesian
+        round trips.
+        :return: (dx, dy, dz)
+        """
+        if isinstance(other, SphericalPoint):
+            dx = (other._r * other._sin_theta * other._cos_phi -
+                  self._r * self._sin_theta * self._cos_phi)
+            dy = (other._r * other._sin_theta * other._sin_phi -
+                  self._r * self._sin_theta * self._sin_phi)
+            dz = other._r * other._cos_theta - self._r * self._cos_theta
+        else:
+            dx = other.x - self.x
+            dy = other.y - self.y
+            dz = other.z - self.z
+        return dx, dy, dz
+
+    def _delta_and_dist(self, other: "Point") -> tuple[float, float, float, float]:
+        """
+        Fused Cartesian delta and distance to another point, for callers
+        that need the separation direction and the distance for the same
+        pair.
+        :return: (dx, dy, dz, distance)
+        """
+        dx, dy, dz = self._delta(other)
+        return dx, dy, dz, math.hypot(dx, dy, dz)
 
     def direction_to(self, other: "Point") -> tuple[float, float]:
         """
         Calculate the angular direction (theta, phi) from this point toward another.
         Returns the angles in the local spherical coordinate system.
         """
-        dx = other.x - self.x
-        dy = other.y - self.y
-        dz = other.z - self.z
-
-        dist = math.sqrt(dx**2 + dy**2 + dz**2)
+        dx, dy, dz, dist = self._delta_and_dist(other)
         if dist == 0:
             return 0.0, 0.0
 
@@ -1,7 +1,10 @@
 from __future__ import annotations
 import math
 
+import numpy as np
+
 from .point import Point
+from ._fasttrig import sincos
 
 
 class SphericalVelocity:
@@ -15,6 +18,8 @@ class SphericalVelocity:
     radial motion is often the dominant component.
     """
 
+    __slots__ = ("_v_r", "_v_theta", "_v_phi")
+
     def __init__(self, v_r: float, v_theta: float, v_phi: float):
         self._v_r = v_r
         self._v_theta = v_theta
@@ -36,13 +41,11 @@ class SphericalVelocity:
 
         if r == 0:
             # At origin, velocity is purely radial in the direction of motion
-            speed = math.sqrt(vx**2 + vy**2 + vz**2)
+            speed = math.hypot(vx, vy, vz)
             return cls(speed, 0.0, 0.0)
 
-        sin_theta = math.sin(theta)
-        cos_theta = math.cos(theta)
-        sin_phi = math.sin(phi)
-        cos_phi = math.cos(phi)
+        sin_theta, cos_theta = sincos(theta)
+        sin_phi, cos_phi = sincos(phi)
 
         # Transform Cartesian velocity to spherical velocity components
         v_r = (vx * sin_theta * cos_phi +
@@ -57,6 +60,89 @@ class SphericalVelocity:
 
         return cls(v_r, v_theta, v_phi)
 
+    @staticmethod
+    def from_cartesian_batch(vx: np.ndarray, vy: np.ndarray, vz: np.ndarray,
+                             r: np.ndarray, theta: np.ndarray,
+                             phi: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert Cartesian velocities to spherical velocity components for a
+        whole batch of positions at once. Vectorized counterpart of
+        from_cartesian: the transformation is a handful of whole-array ufunc
+        ops instead of four scalar sincos calls per element.
+        :param vx: x-components of velocity, shape (N,)
+        :param vy: y-components of velocity, shape (N,)
+        :param vz: z-components of velocity, shape (N,)
+        :param r: radial coordinates of the positions, shape (N,)
+        :param theta: polar angles of the positions, shape (N,)
+        :param phi: azimuthal angles of the positions, shape (N,)
+        :return: tuple of (v_r, v_theta, v_phi) arrays
+        """
+        sin_theta = np.sin(theta)
+        cos_theta = np.cos(theta)
+        sin_phi = np.sin(phi)
+        cos_phi = np.cos(phi)
+
+        off_origin = r > 0
+        r_safe = np.where(off_origin, r, 1.0)
+
+        # At the origin, velocity is purely radial in the direction of motion
+        v_r = np.where(off_origin,
+                       vx * sin_theta * cos_phi +
+                       vy * sin_theta * sin_phi +
+                       vz * cos_theta,
+                       np.sqrt(vx * vx + vy * vy + vz * vz))
+
+        v_theta = np.where(off_origin,
+                           (vx * cos_theta * cos_phi +
+                            vy * cos_theta * sin_phi -
+                            vz * sin_theta) / r_safe,
+                           0.0)
+
+        denom = r * sin_theta
+        spins = denom != 0
+        v_phi = np.where(spins,
+                         (-vx * sin_phi + vy * cos_phi) / np.where(spins, denom, 1.0),
+                         0.0)
+
+        return v_r, v_theta, v_phi
+
+    @staticmethod
+    def to_cartesian_batch(v_r: np.ndarray, v_theta: np.ndarray, v_phi: np.ndarray,
+                           r: np.ndarray, theta: np.ndarray,
+                           phi: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert spherical velocity components to Cartesian velocities for a
+        whole batch of positions at once. Vectorized counterpart of
+        to_cartesian.
+        :param v_r: radial velocities, shape (N,)
+        :param v_theta: polar angular velocities, shape (N,)
+        :param v_phi: azimuthal angular velocities, shape (N,)
+        :param r: radial coordinates of the positions, shape (N,)
+        :param theta: polar angles of the positions, shape (N,)
+        :param phi: azimuthal angles of the positions, shape (N,)
+        :return: tuple of (vx, vy, vz) arrays
+        """
+        sin_theta = np.sin(theta)
+        cos_theta = np.cos(theta)
+        sin_phi = np.sin(phi)
+        cos_phi = np.cos(phi)
+
+        r_v_theta = r * v_theta
+        r_sin_theta_v_phi = r * sin_theta * v_phi
+
+        vx = (v_r * sin_theta * cos_phi +
+              r_v_theta * cos_theta * cos_phi -
+              r_sin_theta_v_phi * sin_phi)
+
+        vy = (v_r * sin_theta * sin_phi +
+              r_v_theta * cos_theta * sin_phi +
+              r_sin_theta_v_phi * cos_phi)
+
+        vz = (v_r * cos_theta -
+              r_v_theta * sin_theta)
+
+        return vx, vy, vz
+
     def to_cartesian(self, position: Point) -> tuple[float, float, float]:
         """
         Convert spherical velocity to Cartesian velocity at a given position.
@@ -67,10 +153,8 @@ class SphericalVelocity:
         theta = position.theta
         phi = position.phi
 
-        sin_theta = math.sin(theta)
-        cos_theta = math.cos(theta)
-        sin_phi = math.sin(phi)
-        cos_phi = math.cos(phi)
+        sin_theta, cos_theta = sincos(theta)
+        sin_phi, cos_phi = sincos(phi)
 
         # Transform spherical velocity to Cartesian velocity components
         vx = (self._v_r * sin_theta * cos_phi +
@@ -123,11 +207,9 @@ class SphericalVelocity:
         sin_theta = math.sin(position.theta)
 
         # |v|² = v_r² + (r * v_theta)² + (r * sin(theta) * v_phi)²
-        return math.sqrt(
-            self._v_r**2 +
-            (r * self._v_theta)**2 +
-            (r * sin_theta * self._v_phi)**2
-        )
+        v_t = r * self._v_theta
+        v_p = r * sin_theta * self._v_phi
+        return math.sqrt(self._v_r * self._v_r + v_t * v_t + v_p * v_p)
 
     def __add__(self, other: "SphericalVelocity") -> "SphericalVelocity":
         """Add two spherical velocities."""
@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+
+from Models import _barneshut
+from Models.Coordinates._kernels import gravity_forces
+from Models.space_time import SpaceTime
+
+
+class TestBarnesHut(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.n = 500
+        self.x = rng.normal(0, 100, self.n)
+        self.y = rng.normal(0, 100, self.n)
+        self.z = rng.normal(0, 100, self.n)
+        self.m = rng.uniform(1e3, 1e6, self.n)
+        self.G = SpaceTime.Gravitational_Constant
+
+    def _forces(self, func, *args):
+        out = [np.empty(self.n) for _ in range(4)]
+        func(self.x, self.y, self.z, self.m, self.G, *args, *out)
+        return out
+
+    def test_matches_direct_at_zero_theta(self):
+        """With the opening angle closed, the tree is exact summation."""
+        tree = self._forces(_barneshut.compute_forces, 0.0)
+        direct = self._forces(gravity_forces)
+        for got, want in zip(tree, direct):
+            self.assertTrue(np.allclose(got, want, rtol=1e-9))
+
+    def test_approximation_accuracy(self):
+        """At theta=0.5 the potential should hold a few-per-mille error."""
+        tree = self._forces(_barneshut.compute_forces, 0.5)
+        direct = self._forces(gravity_forces)
+        rel = np.abs(tree[3] - direct[3]) / np.abs(direct[3])
+        self.assertLess(rel.max(), 1e-2)
+
+
+if __name__ == "__main__":
+    unittest.main()
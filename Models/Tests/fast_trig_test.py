@@ -0,0 +1,27 @@
+import unittest
+import math
+from Models.Coordinates._fasttrig import sincos, wrap_pi, wrap_two_pi
+
+class TestTrigHelpers(unittest.TestCase):
+
+    def test_sincos_matches_libm(self):
+        """The fused pair must agree exactly with separate sin/cos calls."""
+        for i in range(-300, 300):
+            x = i * 0.05
+            s, c = sincos(x)
+            self.assertEqual(s, math.sin(x))
+            self.assertEqual(c, math.cos(x))
+
+    def test_wrap_pi(self):
+        """Wrapping should match % for small deltas and far-out values."""
+        for x in (-7.0, -math.pi, -0.5, 0.0, 1.0, math.pi, 4.0, 40.0):
+            self.assertAlmostEqual(wrap_pi(x), x % math.pi, places=12)
+
+    def test_wrap_two_pi(self):
+        """Wrapping should match % for small deltas and far-out values."""
+        two_pi = 2 * math.pi
+        for x in (-20.0, -two_pi, -0.5, 0.0, 1.0, two_pi, 7.0, 40.0):
+            self.assertAlmostEqual(wrap_two_pi(x), x % two_pi, places=12)
+
+if __name__ == "__main__":
+    unittest.main()
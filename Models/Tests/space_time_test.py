@@ -37,6 +37,95 @@ class TestAbsFunction(unittest.TestCase):
         self.assertAlmostEqual(mass.position.theta, theta, places=10)
         self.assertAlmostEqual(mass.position.phi, phi, places=10)
 
+    def test_add_masses_bulk(self):
+        """Bulk ingest should match the scalar add_mass conversion."""
+        bulk = self.SpaceTime.add_masses([30, 10], [40, 0], [50, 0],
+                                         [2, 1], [2, 0], [2, 0], [5, 10])
+        single = SpaceTime()
+        expected = [single.add_mass(30, 40, 50, 2, 2, 2, 5),
+                    single.add_mass(10, 0, 0, 1, 0, 0, 10)]
+        for got, want in zip(bulk, expected):
+            self.assertAlmostEqual(got.x, want.x, places=10)
+            self.assertAlmostEqual(got.y, want.y, places=10)
+            self.assertAlmostEqual(got.z, want.z, places=10)
+            self.assertAlmostEqual(got.speed, want.speed, places=10)
+            self.assertEqual(got.mass, want.mass)
+
+    def test_finalize_matches_unfinalized_run(self):
+        """A finalized spacetime should evolve identically to a fresh one."""
+        plain = SpaceTime()
+        for st in (self.SpaceTime, plain):
+            st.add_mass(10, 0, 0, 1, 0, 0, 10)
+            st.add_mass(0, 20, 0, 0, -1, 0, 5)
+        self.SpaceTime.finalize()
+
+        for _ in range(3):
+            self.SpaceTime.update(1)
+            plain.update(1)
+
+        for got, want in zip(self.SpaceTime.masses, plain.masses):
+            self.assertAlmostEqual(got.x, want.x, places=10)
+            self.assertAlmostEqual(got.y, want.y, places=10)
+            self.assertAlmostEqual(got.z, want.z, places=10)
+
+    def test_distance_matrix_matches_pairwise(self):
+        """The matrix queries should agree with the per-pair scalar path."""
+        masses = [self.SpaceTime.add_mass(30, 40, 50, 0, 0, 0, 5),
+                  self.SpaceTime.add_mass(10, 0, 0, 0, 0, 0, 10),
+                  self.SpaceTime.add_mass(-20, 7, 3, 0, 0, 0, 2),
+                  self.SpaceTime.add_mass(0, 0, -15, 0, 0, 0, 8)]
+        distances = self.SpaceTime.distance_matrix()
+        distances_sq = self.SpaceTime.distance_sq_matrix()
+        for a in masses:
+            # The diagonal must be exactly zero, not norm-identity residue
+            self.assertEqual(distances_sq[a.index, a.index], 0.0)
+            for b in masses:
+                want = a.distance_from(b)
+                self.assertAlmostEqual(distances[a.index, b.index], want, places=8)
+                self.assertAlmostEqual(distances_sq[a.index, b.index],
+                                       want * want, places=6)
+
+    def test_distance_sq_matrix_finalized_buffer_reuse(self):
+        """The buffer-reusing branch must match the allocating branch."""
+        for position in ((30, 40, 50), (10, 0, 0), (-20, 7, 3)):
+            self.SpaceTime.add_mass(*position, 0, 0, 0, 5)
+        plain = self.SpaceTime.distance_sq_matrix().copy()
+        self.SpaceTime.finalize()
+        for _ in range(2):
+            reused = self.SpaceTime.distance_sq_matrix()
+            for got, want in zip(reused.ravel(), plain.ravel()):
+                self.assertAlmostEqual(got, want, places=10)
+
+    def test_gravitational_potentials_matches_pairwise(self):
+        """The bulk potential query should agree with per-pair sums."""
+        masses = [self.SpaceTime.add_mass(30, 40, 50, 0, 0, 0, 5e14),
+                  self.SpaceTime.add_mass(10, 0, 0, 0, 0, 0, 1e15),
+                  self.SpaceTime.add_mass(-20, 7, 3, 0, 0, 0, 2e14)]
+        potentials = self.SpaceTime.gravitational_potentials()
+        for a in masses:
+            want = sum(a.get_gravitational_potential(b)
+                       for b in masses if b is not a)
+            self.assertAlmostEqual(potentials[a.index], want,
+                                   delta=abs(want) * 1e-9)
+
+    def test_apply_gravity_precomputed_distances(self):
+        """Passing precomputed distance rows must not change the result."""
+        masses = [self.SpaceTime.add_mass(30, 40, 50, 0, 0, 0, 5e14),
+                  self.SpaceTime.add_mass(10, 0, 0, 0, 0, 0, 1e15),
+                  self.SpaceTime.add_mass(-20, 7, 3, 0, 0, 0, 2e14)]
+        distances = self.SpaceTime.distance_matrix()
+        distances_sq = self.SpaceTime.distance_sq_matrix()
+        probe = masses[0]
+        probe.apply_gravity(masses)
+        want = (probe.net_force.F_r, probe.net_force.F_theta,
+                probe.net_force.F_phi, probe.gravitational_potential)
+        probe.apply_gravity(masses, distances=distances[probe.index],
+                            distances_sq=distances_sq[probe.index])
+        got = (probe.net_force.F_r, probe.net_force.F_theta,
+               probe.net_force.F_phi, probe.gravitational_potential)
+        for g, w in zip(got, want):
+            self.assertAlmostEqual(g, w, delta=abs(w) * 1e-9)
+
     def test_update_mass_radial_velocity(self):
         """Test mass movement with purely radial velocity."""
         # Start at (10, 0, 0) with radial velocity pointing outward
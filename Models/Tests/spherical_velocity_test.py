@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+
+from Models.Coordinates.spherical_point import SphericalPoint
+from Models.Coordinates.spherical_velocity import SphericalVelocity
+
+
+class TestSphericalVelocityBatch(unittest.TestCase):
+
+    def setUp(self):
+        # Sample positions include the origin and a point on the polar
+        # axis to exercise the guard branches
+        self.points = [(30.0, 40.0, 50.0), (10.0, 0.0, 0.0),
+                       (-20.0, 7.0, 3.0), (0.0, 0.0, 15.0), (0.0, 0.0, 0.0)]
+        self.velocities = [(2.0, 2.0, 2.0), (0.0, -1.0, 0.5),
+                           (3.0, 0.0, 0.0), (1.0, 2.0, -1.0), (0.5, 0.5, 0.5)]
+        positions = [SphericalPoint(*p) for p in self.points]
+        self.r = np.array([p.r for p in positions])
+        self.theta = np.array([p.theta for p in positions])
+        self.phi = np.array([p.phi for p in positions])
+        self.positions = positions
+
+    def test_from_cartesian_batch_matches_scalar(self):
+        """The batch conversion should agree with per-element from_cartesian."""
+        vx, vy, vz = (np.array(c) for c in zip(*self.velocities))
+        v_r, v_theta, v_phi = SphericalVelocity.from_cartesian_batch(
+            vx, vy, vz, self.r, self.theta, self.phi)
+        for i, (position, velocity) in enumerate(zip(self.positions,
+                                                     self.velocities)):
+            want = SphericalVelocity.from_cartesian(*velocity, position)
+            self.assertAlmostEqual(v_r[i], want.v_r, places=10)
+            self.assertAlmostEqual(v_theta[i], want.v_theta, places=10)
+            self.assertAlmostEqual(v_phi[i], want.v_phi, places=10)
+
+    def test_to_cartesian_batch_matches_scalar(self):
+        """The batch conversion should agree with per-element to_cartesian."""
+        vx, vy, vz = (np.array(c) for c in zip(*self.velocities))
+        v_r, v_theta, v_phi = SphericalVelocity.from_cartesian_batch(
+            vx, vy, vz, self.r, self.theta, self.phi)
+        back = SphericalVelocity.to_cartesian_batch(
+            v_r, v_theta, v_phi, self.r, self.theta, self.phi)
+        for i, position in enumerate(self.positions):
+            want = SphericalVelocity(v_r[i], v_theta[i],
+                                     v_phi[i]).to_cartesian(position)
+            for got_c, want_c in zip((c[i] for c in back), want):
+                self.assertAlmostEqual(got_c, want_c, places=10)
+
+    def test_round_trip(self):
+        """Off the origin and poles, the two conversions must invert."""
+        off_axis = slice(0, 3)
+        vx, vy, vz = (np.array(c[off_axis]) for c in zip(*self.velocities))
+        r = self.r[off_axis]
+        theta = self.theta[off_axis]
+        phi = self.phi[off_axis]
+        v_r, v_theta, v_phi = SphericalVelocity.from_cartesian_batch(
+            vx, vy, vz, r, theta, phi)
+        back_x, back_y, back_z = SphericalVelocity.to_cartesian_batch(
+            v_r, v_theta, v_phi, r, theta, phi)
+        for got, want in zip((back_x, back_y, back_z), (vx, vy, vz)):
+            for g, w in zip(got, want):
+                self.assertAlmostEqual(g, w, places=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,10 @@
 from .mass import Mass
 from .space_time import SpaceTime
-from .point import Point
-from .point3d import Point3D
-from .spherical_point import SphericalPoint
-from .spherical_velocity import SphericalVelocity
-from .spherical_force import SphericalForce
+from .Coordinates.point import Point
+from .Coordinates.point3d import Point3D
+from .Coordinates.spherical_point import SphericalPoint
+from .Coordinates.spherical_velocity import SphericalVelocity
+from .Coordinates.spherical_force import SphericalForce
 
 
 __all__ = [
@@ -0,0 +1,249 @@
+from __future__ import annotations
+import math
+
+import numpy as np
+from numba import njit, prange
+
+_MAX_DEPTH = 48
+"""
+Insertion depth cap. Bodies that still collide at this depth are within
+size / 2^48 of each other and get merged into one leaf.
+"""
+
+_EMPTY = -1
+"""Child-slot marker for an empty octant."""
+
+
+@njit(cache=True, fastmath=True)
+def _build(x, y, z, m, cx, cy, cz, half, child, node_m, node_mx, node_my,
+           node_mz, leaf_body, root_cx, root_cy, root_cz, root_half):
+    """
+    Build the octree by inserting bodies one at a time.
+
+    Nodes live in flat preallocated arrays: child holds the eight octant
+    links per node, leaf_body is the body index for single-body leaves
+    (-1 for internal nodes), and node_m / node_m{x,y,z} accumulate the
+    mass and mass-weighted position sums as each insertion passes
+    through, so no separate bottom-up pass is needed.
+
+    :return: the number of nodes used, or -1 if capacity was exhausted
+    """
+    n = x.shape[0]
+    cap = child.shape[0]
+
+    cx[0] = root_cx
+    cy[0] = root_cy
+    cz[0] = root_cz
+    half[0] = root_half
+    leaf_body[0] = _EMPTY
+    next_free = 1
+
+    for i in range(n):
+        xi = x[i]
+        yi = y[i]
+        zi = z[i]
+        mi = m[i]
+        node = 0
+        depth = 0
+        while True:
+            node_m[node] += mi
+            node_mx[node] += mi * xi
+            node_my[node] += mi * yi
+            node_mz[node] += mi * zi
+
+            oct_ = 0
+            if xi > cx[node]:
+                oct_ += 1
+            if yi > cy[node]:
+                oct_ += 2
+            if zi > cz[node]:
+                oct_ += 4
+
+            c = child[node, oct_]
+            if c == _EMPTY:
+                # Empty octant: drop the body in as a new leaf
+                if next_free >= cap:
+                    return -1
+                leaf = next_free
+                next_free += 1
+                q = half[node] * 0.5
+                cx[leaf] = cx[node] + (q if xi > cx[node] else -q)
+                cy[leaf] = cy[node] + (q if yi > cy[node] else -q)
+                cz[leaf] = cz[node] + (q if zi > cz[node] else -q)
+                half[leaf] = q
+                leaf_body[leaf] = i
+                node_m[leaf] = mi
+                node_mx[leaf] = mi * xi
+                node_my[leaf] = mi * yi
+                node_mz[leaf] = mi * zi
+                child[node, oct_] = leaf
+                break
+
+            if leaf_body[c] != _EMPTY and depth < _MAX_DEPTH:
+                # Occupied leaf: push its body one level down, then keep
+                # descending with the new body from the same node
+                old = leaf_body[c]
+                leaf_body[c] = _EMPTY
+                ox = x[old]
+                oy = y[old]
+                oz = z[old]
+                oct_old = 0
+                if ox > cx[c]:
+                    oct_old += 1
+                if oy > cy[c]:
+                    oct_old += 2
+                if oz > cz[c]:
+                    oct_old += 4
+                if next_free >= cap:
+                    return -1
+                leaf = next_free
+                next_free += 1
+                q = half[c] * 0.5
+                cx[leaf] = cx[c] + (q if ox > cx[c] else -q)
+                cy[leaf] = cy[c] + (q if oy > cy[c] else -q)
+                cz[leaf] = cz[c] + (q if oz > cz[c] else -q)
+                half[leaf] = q
+                leaf_body[leaf] = old
+                mo = m[old]
+                node_m[leaf] = mo
+                node_mx[leaf] = mo * ox
+                node_my[leaf] = mo * oy
+                node_mz[leaf] = mo * oz
+                child[c, oct_old] = leaf
+
+            if leaf_body[c] != _EMPTY:
+                # Depth cap reached: merge into the existing leaf
+                node_m[c] += mi
+                node_mx[c] += mi * xi
+                node_my[c] += mi * yi
+                node_mz[c] += mi * zi
+                break
+
+            node = c
+            depth += 1
+
+    return next_free
+
+
+@njit(cache=True, fastmath=True, parallel=True, error_model="numpy")
+def _walk(x, y, z, m, G, theta_sq, cx, cy, cz, half, child, node_m,
+          node_mx, node_my, node_mz, leaf_body, Fx, Fy, Fz, potentials):
+    """
+    Accumulate each body's force and potential by walking the tree.
+
+    A node is accepted as a single far-field source when
+    (node size)^2 < theta^2 * d^2 with d measured to its center of mass;
+    otherwise its children are pushed onto the walk stack. Leaves holding
+    the body itself (or exactly coincident bodies) are skipped by the
+    r2 > 0 guard.
+    """
+    n = x.shape[0]
+    for i in prange(n):
+        xi = x[i]
+        yi = y[i]
+        zi = z[i]
+        fx = 0.0
+        fy = 0.0
+        fz = 0.0
+        pot = 0.0
+        # DFS stack: at most seven siblings stay queued per level
+        stack = np.empty(8 * _MAX_DEPTH + 8, dtype=np.int64)
+        stack[0] = 0
+        sp = 1
+        while sp > 0:
+            sp -= 1
+            node = stack[sp]
+            mass = node_m[node]
+            if mass == 0.0:
+                continue
+            inv_m = 1.0 / mass
+            dx = node_mx[node] * inv_m - xi
+            dy = node_my[node] * inv_m - yi
+            dz = node_mz[node] * inv_m - zi
+            r2 = dx * dx + dy * dy + dz * dz
+
+            size = 2.0 * half[node]
+            is_leaf = leaf_body[node] != _EMPTY
+            if is_leaf and leaf_body[node] == i:
+                continue
+            if is_leaf or size * size < theta_sq * r2:
+                if r2 > 0.0:
+                    inv_r = 1.0 / math.sqrt(r2)
+                    inv_r3 = inv_r / r2
+                    fx += mass * dx * inv_r3
+                    fy += mass * dy * inv_r3
+                    fz += mass * dz * inv_r3
+                    pot += mass * inv_r
+            else:
+                for oct_ in range(8):
+                    c = child[node, oct_]
+                    if c != _EMPTY:
+                        stack[sp] = c
+                        sp += 1
+        Gm_i = G * m[i]
+        Fx[i] = Gm_i * fx
+        Fy[i] = Gm_i * fy
+        Fz[i] = Gm_i * fz
+        potentials[i] = -G * pot
+
+
+def compute_forces(x, y, z, m, G, theta, Fx, Fy, Fz, potentials) -> bool:
+    """
+    Barnes-Hut approximation of every body's net gravitational force and
+    potential, O(N log N) instead of the direct kernel's O(N^2).
+
+    Distant clusters are summarized by their total mass at their center of
+    mass; theta controls the size/distance ratio below which a cluster is
+    accepted (0.5 is the usual accuracy/speed trade-off, 0 degenerates to
+    direct summation).
+
+    :param x: Cartesian x positions, shape (N,)
+    :param y: Cartesian y positions, shape (N,)
+    :param z: Cartesian z positions, shape (N,)
+    :param m: masses in kg, shape (N,)
+    :param G: the gravitational constant
+    :param theta: opening angle for the cluster acceptance test
+    :param Fx: output net force x components, shape (N,)
+    :param Fy: output net force y components, shape (N,)
+    :param Fz: output net force z components, shape (N,)
+    :param potentials: output gravitational potentials, shape (N,)
+    :return: True on success, False if the tree build ran out of node
+             capacity (caller should fall back to direct summation)
+    """
+    n = x.shape[0]
+    if n == 0:
+        return True
+
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    z = np.ascontiguousarray(z, dtype=np.float64)
+
+    root_cx = 0.5 * (x.min() + x.max())
+    root_cy = 0.5 * (y.min() + y.max())
+    root_cz = 0.5 * (z.min() + z.max())
+    root_half = 0.5 * max(x.max() - x.min(), y.max() - y.min(),
+                          z.max() - z.min())
+    if root_half == 0.0:
+        root_half = 1.0
+
+    cap = 8 * n + 64
+    cx = np.empty(cap, dtype=np.float64)
+    cy = np.empty(cap, dtype=np.float64)
+    cz = np.empty(cap, dtype=np.float64)
+    half = np.empty(cap, dtype=np.float64)
+    child = np.full((cap, 8), _EMPTY, dtype=np.int64)
+    node_m = np.zeros(cap, dtype=np.float64)
+    node_mx = np.zeros(cap, dtype=np.float64)
+    node_my = np.zeros(cap, dtype=np.float64)
+    node_mz = np.zeros(cap, dtype=np.float64)
+    leaf_body = np.empty(cap, dtype=np.int64)
+
+    used = _build(x, y, z, m, cx, cy, cz, half, child, node_m, node_mx,
+                  node_my, node_mz, leaf_body, root_cx, root_cy, root_cz,
+                  root_half)
+    if used < 0:
+        return False
+
+    _walk(x, y, z, m, G, theta * theta, cx, cy, cz, half, child, node_m,
+          node_mx, node_my, node_mz, leaf_body, Fx, Fy, Fz, potentials)
+    return True
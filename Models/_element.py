@@ -1,14 +1,28 @@
 from __future__ import annotations
 
-from Coordinates.spherical_point import SphericalPoint
-from Coordinates.spherical_velocity import SphericalVelocity
+from typing import TYPE_CHECKING
+
+from .Coordinates.spherical_point import SphericalPoint
+from .Coordinates.spherical_velocity import SphericalVelocity
+from .Coordinates._fasttrig import wrap_pi, wrap_two_pi
+
+if TYPE_CHECKING:
+    from .space_time import SpaceTime
 
 
 class _Element:
-    def __init__(self, x: float, y: float, z: float, vx: float, vy: float, vz: float):
-        """
-        Initialize an Element object from Cartesian coordinates.
-        Internally stores position and velocity in spherical coordinates.
+
+    __slots__ = ("_space_time", "_index")
+
+    def __init__(self, space_time: "SpaceTime", index: int,
+                 x: float, y: float, z: float, vx: float, vy: float, vz: float):
+        """
+        Initialize an Element handle from Cartesian coordinates.
+        State lives in the SpaceTime's structure-of-arrays buffers; this
+        object only holds its index into them. Position and velocity are
+        stored in spherical coordinates.
+        :param space_time: the SpaceTime whose arrays hold this element's state
+        :param index: this element's slot in the SpaceTime arrays
         :param x: the initial x position (Cartesian)
         :param y: the initial y position (Cartesian)
         :param z: the initial z position (Cartesian)
@@ -16,22 +30,32 @@ class _Element:
         :param vy: the initial y velocity (Cartesian)
         :param vz: the initial z velocity (Cartesian)
         """
-        self.position = SphericalPoint(x, y, z)
-        self._velocity = SphericalVelocity.from_cartesian(vx, vy, vz, self.position)
-        self._age = 0.0
+        self._space_time = space_time
+        self._index = index
+
+        position = SphericalPoint(x, y, z)
+        velocity = SphericalVelocity.from_cartesian(vx, vy, vz, position)
+
+        space_time.r[index] = position.r
+        space_time.theta[index] = position.theta
+        space_time.phi[index] = position.phi
+        space_time.v_r[index] = velocity.v_r
+        space_time.v_theta[index] = velocity.v_theta
+        space_time.v_phi[index] = velocity.v_phi
+        space_time.ages[index] = 0.0
 
     def time_step(self, dt: float):
         """
-        Update the Element's position based on its velocity and the time delta.
-        Uses spherical coordinate dynamics.
+        Update this single Element's position based on its velocity and the
+        time delta. The simulation hot loop bypasses this and steps all
+        elements at once in SpaceTime.update; this remains for one-off use.
         :param dt: The amount of time passed
         :return: None
         """
-        # Update spherical coordinates directly
-        self.position.r += self._velocity.v_r * dt
-        self.position.theta += self._velocity.v_theta * dt
-        self.position.phi += self._velocity.v_phi * dt
-        self._age += dt
+        self.r += self.v_r * dt
+        self.theta += self.v_theta * dt
+        self.phi += self.v_phi * dt
+        self._space_time.ages[self._index] += dt
 
     def distance_from(self, other: "_Element") -> float:
         """
@@ -42,6 +66,65 @@ class _Element:
         """
         return self.position.distance_to(other.position)
 
+    def distance_sq_from(self, other: "_Element") -> float:
+        """
+        Calculate the squared distance from this Element to another
+        Element, skipping the sqrt. Anything comparing distances or
+        feeding an inverse-square law should prefer this over
+        distance_from.
+        :param other: The other Element object
+        :return: The squared distance between the two Element objects
+        """
+        return self.position.distance_squared_to(other.position)
+
+    @property
+    def index(self) -> int:
+        """
+        :return: This Element's slot in the SpaceTime state arrays
+        """
+        return self._index
+
+    @property
+    def position(self) -> SphericalPoint:
+        """
+        :return: The Element's position as a SphericalPoint snapshot of the
+                 current array state
+        """
+        return SphericalPoint.from_spherical(self.r, self.theta, self.phi)
+
+    @property
+    def r(self) -> float:
+        """
+        :return: The Element's radial coordinate
+        """
+        return self._space_time.r[self._index]
+
+    @r.setter
+    def r(self, value: float):
+        self._space_time.r[self._index] = max(0.0, value)
+
+    @property
+    def theta(self) -> float:
+        """
+        :return: The Element's polar angle
+        """
+        return self._space_time.theta[self._index]
+
+    @theta.setter
+    def theta(self, value: float):
+        self._space_time.theta[self._index] = wrap_pi(value)
+
+    @property
+    def phi(self) -> float:
+        """
+        :return: The Element's azimuthal angle
+        """
+        return self._space_time.phi[self._index]
+
+    @phi.setter
+    def phi(self, value: float):
+        self._space_time.phi[self._index] = wrap_two_pi(value)
+
     @property
     def x(self) -> float:
         """
@@ -63,12 +146,46 @@ class _Element:
         """
         return self.position.z
 
+    @property
+    def v_r(self) -> float:
+        """
+        :return: The Element's radial velocity
+        """
+        return self._space_time.v_r[self._index]
+
+    @v_r.setter
+    def v_r(self, value: float):
+        self._space_time.v_r[self._index] = value
+
+    @property
+    def v_theta(self) -> float:
+        """
+        :return: The Element's polar angular velocity
+        """
+        return self._space_time.v_theta[self._index]
+
+    @v_theta.setter
+    def v_theta(self, value: float):
+        self._space_time.v_theta[self._index] = value
+
+    @property
+    def v_phi(self) -> float:
+        """
+        :return: The Element's azimuthal angular velocity
+        """
+        return self._space_time.v_phi[self._index]
+
+    @v_phi.setter
+    def v_phi(self, value: float):
+        self._space_time.v_phi[self._index] = value
+
     @property
     def velocity(self) -> SphericalVelocity:
         """
-        :return: The Element's velocity in spherical coordinates
+        :return: The Element's velocity as a SphericalVelocity snapshot of
+                 the current array state
         """
-        return self._velocity
+        return SphericalVelocity(self.v_r, self.v_theta, self.v_phi)
 
     @velocity.setter
     def velocity(self, value: SphericalVelocity):
@@ -76,15 +193,17 @@ class _Element:
         Set the Element's velocity
         :param value: The new velocity (SphericalVelocity)
         """
-        self._velocity = value
+        self.v_r = value.v_r
+        self.v_theta = value.v_theta
+        self.v_phi = value.v_phi
 
     @property
     def speed(self) -> float:
         """
         :return: The Element's speed (magnitude of velocity)
         """
-        return self._velocity.magnitude(self.position)
+        return self.velocity.magnitude(self.position)
 
     @property
     def age(self) -> float:
-        return self._age
+        return self._space_time.ages[self._index]
@@ -0,0 +1,139 @@
+from __future__ import annotations
+import math
+
+import numpy as np
+from numba import cuda
+
+"""
+CUDA offload for the N^2 gravity kernel. Each GPU thread owns one target
+element and accumulates the force from every source element, loading
+source data tile-by-tile into shared memory so global memory is read
+N/TPB times instead of N times per thread.
+
+Everything here is optional: SpaceTime only imports this module when a
+simulation is constructed with use_gpu=True, and gpu_available() reports
+whether a CUDA device is actually present.
+"""
+
+TPB = 256  # threads per block; also the shared-memory tile size
+
+
+def gpu_available() -> bool:
+    """
+    :return: Whether a usable CUDA device is present.
+    """
+    try:
+        return cuda.is_available()
+    except Exception:
+        return False
+
+
+@cuda.jit
+def nbody_forces(r, theta, phi, m, G, out_F_r, out_F_theta, out_F_phi, out_potential):
+    """
+    Accumulate, for each element i, the net gravitational force in the
+    spherical basis at i's position plus the total potential there.
+    Mirrors Mass.force_from / get_gravitational_potential.
+    """
+    i = cuda.grid(1)
+    n = r.shape[0]
+
+    tile = cuda.shared.array(shape=(TPB, 4), dtype=np.float64)
+    tx = cuda.threadIdx.x
+
+    if i < n:
+        r_i = r[i]
+        sin_theta_i = math.sin(theta[i])
+        cos_theta_i = math.cos(theta[i])
+        sin_phi_i = math.sin(phi[i])
+        cos_phi_i = math.cos(phi[i])
+        x_i = r_i * sin_theta_i * cos_phi_i
+        y_i = r_i * sin_theta_i * sin_phi_i
+        z_i = r_i * cos_theta_i
+        m_i = m[i]
+    else:
+        x_i = y_i = z_i = m_i = 0.0
+        sin_theta_i = cos_theta_i = sin_phi_i = cos_phi_i = 0.0
+
+    F_r = 0.0
+    F_theta = 0.0
+    F_phi = 0.0
+    potential = 0.0
+
+    for tile_start in range(0, n, TPB):
+        j = tile_start + tx
+        if j < n:
+            r_j = r[j]
+            sin_theta_j = math.sin(theta[j])
+            tile[tx, 0] = r_j * sin_theta_j * math.cos(phi[j])
+            tile[tx, 1] = r_j * sin_theta_j * math.sin(phi[j])
+            tile[tx, 2] = r_j * math.cos(theta[j])
+            tile[tx, 3] = m[j]
+        cuda.syncthreads()
+
+        if i < n:
+            tile_len = min(TPB, n - tile_start)
+            for k in range(tile_len):
+                j = tile_start + k
+                if j == i:
+                    continue
+                dx = tile[k, 0] - x_i
+                dy = tile[k, 1] - y_i
+                dz = tile[k, 2] - z_i
+                dist_sq = dx * dx + dy * dy + dz * dz
+                if dist_sq == 0.0:
+                    continue
+                dist = math.sqrt(dist_sq)
+
+                potential -= G * tile[k, 3] / dist
+
+                # Unit vector toward the source, projected onto the
+                # spherical basis (e_r, e_theta, e_phi) at this position
+                magnitude = G * tile[k, 3] * m_i / dist_sq
+                ux = dx / dist
+                uy = dy / dist
+                uz = dz / dist
+                F_r += magnitude * (ux * sin_theta_i * cos_phi_i +
+                                    uy * sin_theta_i * sin_phi_i +
+                                    uz * cos_theta_i)
+                F_theta += magnitude * (ux * cos_theta_i * cos_phi_i +
+                                        uy * cos_theta_i * sin_phi_i -
+                                        uz * sin_theta_i)
+                F_phi += magnitude * (-ux * sin_phi_i + uy * cos_phi_i)
+        cuda.syncthreads()
+
+    if i < n:
+        out_F_r[i] = F_r
+        out_F_theta[i] = F_theta
+        out_F_phi[i] = F_phi
+        out_potential[i] = potential
+
+
+def compute_forces(r, theta, phi, m, G):
+    """
+    Host-side wrapper: copies the SoA state to the device, launches
+    nbody_forces, and returns the per-element force components and
+    potentials as host arrays.
+    :param r: radial coordinates, shape (N,)
+    :param theta: polar angles, shape (N,)
+    :param phi: azimuthal angles, shape (N,)
+    :param m: element masses, shape (N,)
+    :param G: the gravitational constant
+    :return: tuple of (F_r, F_theta, F_phi, potential) arrays
+    """
+    n = r.size
+    d_r = cuda.to_device(r)
+    d_theta = cuda.to_device(theta)
+    d_phi = cuda.to_device(phi)
+    d_m = cuda.to_device(m)
+    d_F_r = cuda.device_array(n, dtype=np.float64)
+    d_F_theta = cuda.device_array(n, dtype=np.float64)
+    d_F_phi = cuda.device_array(n, dtype=np.float64)
+    d_potential = cuda.device_array(n, dtype=np.float64)
+
+    blocks = (n + TPB - 1) // TPB
+    nbody_forces[blocks, TPB](d_r, d_theta, d_phi, d_m, G,
+                              d_F_r, d_F_theta, d_F_phi, d_potential)
+
+    return (d_F_r.copy_to_host(), d_F_theta.copy_to_host(),
+            d_F_phi.copy_to_host(), d_potential.copy_to_host())
@@ -3,12 +3,19 @@ from typing import TYPE_CHECKING
 import math
 
 from ._element import _Element
-from .spherical_velocity import SphericalVelocity
-from .spherical_force import SphericalForce
+from .Coordinates.spherical_force import SphericalForce
+from .Coordinates.spherical_point import SphericalPoint
 
 if TYPE_CHECKING:
     from .space_time import SpaceTime
 
+_G : float = 6.67408e-11 # m^2 kg^-1 s^-2
+"""
+The gravitational constant. Module-level so the scalar force and
+potential paths read it with a global load instead of a class-attribute
+lookup per pair; SpaceTime.Gravitational_Constant aliases this value.
+"""
+
 
 class Mass(_Element):
     """
@@ -17,9 +24,14 @@ class Mass(_Element):
     which is ideal for gravitational simulations and Schwarzschild metric.
     """
 
-    def __init__(self, x: float, y: float, z: float, vx: float, vy: float, vz: float, mass: float):
+    __slots__ = ("_mass", "_total_gravitational_potential", "_net_force")
+
+    def __init__(self, space_time: "SpaceTime", index: int,
+                 x: float, y: float, z: float, vx: float, vy: float, vz: float, mass: float):
         """
         Constructs a Mass object from Cartesian coordinates.
+        :param space_time: the SpaceTime whose arrays hold this mass's state
+        :param index: this mass's slot in the SpaceTime arrays
         :param x: the initial x position (Cartesian)
         :param y: the initial y position (Cartesian)
         :param z: the initial z position (Cartesian)
@@ -28,27 +40,92 @@ class Mass(_Element):
         :param vz: the initial z velocity (Cartesian)
         :param mass: the mass of the Mass (kg)
         """
-        super().__init__(x, y, z, vx, vy, vz)
+        super().__init__(space_time, index, x, y, z, vx, vy, vz)
         self._mass = mass
         self._total_gravitational_potential = 0.0
         self._net_force = SphericalForce()
 
-    def apply_gravity(self, masses: list["Mass"]):
+    @classmethod
+    def _bind(cls, space_time: "SpaceTime", index: int, mass: float) -> "Mass":
+        """
+        Create a Mass handle over an already-populated array slot, skipping
+        the per-object coordinate conversion. Used by SpaceTime's bulk
+        ingest, which converts whole batches at once.
+        :param space_time: the SpaceTime whose arrays hold this mass's state
+        :param index: this mass's slot in the SpaceTime arrays
+        :param mass: the mass of the Mass (kg)
+        """
+        instance = cls.__new__(cls)
+        instance._space_time = space_time
+        instance._index = index
+        instance._mass = mass
+        instance._total_gravitational_potential = 0.0
+        instance._net_force = SphericalForce()
+        return instance
+
+    def apply_gravity(self, masses: list["Mass"], distances=None, distances_sq=None):
         """
         Applies all the effects of gravity from the list of masses to this mass.
         Calculates force in spherical coordinates where gravity is naturally radial.
+        This mass itself may appear in the list and is skipped, so callers
+        can pass the full shared population instead of building an N-1
+        element copy per mass.
         :param masses: the list of masses to calculate gravitational effects from
+        :param distances: optional row of a precomputed pairwise distance
+                          matrix, indexed by each mass's element index
+        :param distances_sq: optional row of the squared distance matrix,
+                             saving the force law a redundant multiply
         :return: None
         """
-        self._net_force.reset()
-        self._total_gravitational_potential = 0.0
+        # Hoist everything that depends only on this mass out of the pair
+        # loop: one position snapshot (whose sin/cos are cached on it)
+        # instead of N-1, and a local binding for the constant
+        position = self.position
+        G = _G
 
-        for other_mass in masses:
-            self._add_gravitational_potential(other_mass)
-            force = self.force_from(other_mass)
-            self._net_force = self._net_force + force
+        # Accumulate in plain floats; the net force object is written once
+        # after the loop instead of allocating a SphericalForce per pair
+        fr = ft = fp = 0.0
+        potential = 0.0
 
-    def force_from(self, other: "Mass") -> SphericalForce:
+        for other_mass in masses:
+            if other_mass is self:
+                continue
+            distance = (self.distance_from(other_mass) if distances is None
+                        else distances[other_mass.index])
+            distance_sq = (None if distances_sq is None
+                           else distances_sq[other_mass.index])
+            if distance != 0:
+                potential -= G * other_mass.mass / distance
+            F_r, F_theta, F_phi = self._force_components_from(
+                other_mass, distance, distance_sq, position)
+            fr += F_r
+            ft += F_theta
+            fp += F_phi
+
+        self._net_force.F_r = fr
+        self._net_force.F_theta = ft
+        self._net_force.F_phi = fp
+        self._total_gravitational_potential = potential
+
+    def _set_gravity(self, F_r: float, F_theta: float, F_phi: float, potential: float):
+        """
+        Install gravity results computed externally (e.g. by the GPU
+        kernel) instead of accumulating them pair by pair.
+        :param F_r: net radial force component
+        :param F_theta: net polar force component
+        :param F_phi: net azimuthal force component
+        :param potential: total gravitational potential at this position
+        :return: None
+        """
+        self._net_force.F_r = F_r
+        self._net_force.F_theta = F_theta
+        self._net_force.F_phi = F_phi
+        self._total_gravitational_potential = potential
+
+    def force_from(self, other: "Mass", distance: float = None,
+                   distance_sq: float = None,
+                   position: SphericalPoint = None) -> SphericalForce:
         """
         Calculate the gravitational force from the other mass on this mass.
         Returns force in spherical coordinates relative to this mass's position.
@@ -57,84 +134,102 @@ class Mass(_Element):
         which is a natural representation in spherical coordinates.
 
         :param other: the other mass to calculate force from.
+        :param distance: the distance to the other mass, if already known
+        :param distance_sq: the squared distance, if already known
+        :param position: a snapshot of this mass's position, if already
+                         taken; accumulation loops pass one snapshot for
+                         all pairs instead of rebuilding it per call
         :return: SphericalForce representing the gravitational attraction
         """
-        from .space_time import SpaceTime
-
-        distance = self.distance_from(other)
-        if distance == 0:
-            return SphericalForce()
-
-        # Gravitational force magnitude (always attractive, toward other mass)
-        magnitude = (SpaceTime.Gravitational_Constant * other.mass * self.mass) / (distance ** 2)
-
-        # Calculate direction angles from this mass to the other mass
-        # These angles define the direction of the force in spherical coordinates
-        theta_dir, phi_dir = self.position.direction_to(other.position)
+        return SphericalForce(*self._force_components_from(
+            other, distance, distance_sq, position))
 
-        # Decompose the force into spherical components at this mass's position
-        # The force points from this mass toward the other mass
-        sin_theta_dir = math.sin(theta_dir)
-        cos_theta_dir = math.cos(theta_dir)
-        sin_phi_dir = math.sin(phi_dir)
-        cos_phi_dir = math.cos(phi_dir)
-
-        # Transform force direction to spherical components relative to this position
-        sin_theta_pos = math.sin(self.position.theta)
-        cos_theta_pos = math.cos(self.position.theta)
-        sin_phi_pos = math.sin(self.position.phi)
-        cos_phi_pos = math.cos(self.position.phi)
-
-        # Unit vector in direction of other mass (Cartesian)
-        ux = sin_theta_dir * cos_phi_dir
-        uy = sin_theta_dir * sin_phi_dir
-        uz = cos_theta_dir
+    def _force_components_from(self, other: "Mass", distance: float = None,
+                               distance_sq: float = None,
+                               position: SphericalPoint = None
+                               ) -> tuple[float, float, float]:
+        """
+        The components of force_from as a plain tuple, so accumulation
+        loops can sum them into scalars without allocating a
+        SphericalForce per pair.
+        :return: (F_r, F_theta, F_phi)
+        """
+        if position is None:
+            position = self.position
+        dx, dy, dz = position._delta(other.position)
+        if distance_sq is None:
+            distance_sq = (distance * distance if distance is not None
+                           else dx * dx + dy * dy + dz * dz)
+        if distance_sq == 0:
+            return 0.0, 0.0, 0.0
+
+        # Fused force law: G m M / d^2 over the unit vector d / |d| is
+        # G m M d * (d^2)^-1.5, one pow instead of sqrt plus divides
+        k = (_G * other.mass * self.mass) * distance_sq**-1.5
+        fx = k * dx
+        fy = k * dy
+        fz = k * dz
+
+        # The snapshot caches its own sin/cos, so the basis projection
+        # costs no transcendental calls here
+        sin_theta_pos = position._sin_theta
+        cos_theta_pos = position._cos_theta
+        sin_phi_pos = position._sin_phi
+        cos_phi_pos = position._cos_phi
 
         # Project onto spherical basis vectors at this position
         # e_r = (sin(theta)cos(phi), sin(theta)sin(phi), cos(theta))
         # e_theta = (cos(theta)cos(phi), cos(theta)sin(phi), -sin(theta))
         # e_phi = (-sin(phi), cos(phi), 0)
 
-        F_r = magnitude * (ux * sin_theta_pos * cos_phi_pos +
-                          uy * sin_theta_pos * sin_phi_pos +
-                          uz * cos_theta_pos)
+        F_r = (fx * sin_theta_pos * cos_phi_pos +
+               fy * sin_theta_pos * sin_phi_pos +
+               fz * cos_theta_pos)
 
-        F_theta = magnitude * (ux * cos_theta_pos * cos_phi_pos +
-                              uy * cos_theta_pos * sin_phi_pos -
-                              uz * sin_theta_pos)
+        F_theta = (fx * cos_theta_pos * cos_phi_pos +
+                   fy * cos_theta_pos * sin_phi_pos -
+                   fz * sin_theta_pos)
 
-        F_phi = magnitude * (-ux * sin_phi_pos + uy * cos_phi_pos)
+        F_phi = -fx * sin_phi_pos + fy * cos_phi_pos
 
-        return SphericalForce(F_r, F_theta, F_phi)
+        return F_r, F_theta, F_phi
 
-    def _add_gravitational_potential(self, other: "Mass"):
+    def _add_gravitational_potential(self, other: "Mass", distance: float = None):
         """
         Adds the gravitational potential from the provided mass to this mass's total potential.
         Gravitational potential is a scalar, so coordinate system doesn't matter.
         :param other: The other mass to calculate using.
+        :param distance: the distance to the other mass, if already known
         :return: None
         """
-        self._total_gravitational_potential += self.get_gravitational_potential(other)
+        self._total_gravitational_potential += self.get_gravitational_potential(other, distance)
 
-    def get_gravitational_potential(self, other: "Mass") -> float:
+    def get_gravitational_potential(self, other: "Mass", distance: float = None) -> float:
         """
         Calculates the gravitational potential from the other mass that this mass is experiencing.
         :param other: The other mass in the calculation
+        :param distance: the distance to the other mass, if already known
         :return: the gravitational potential in units of Joules/kg
         """
-        distance = self.distance_from(other)
+        if distance is None:
+            # Skip the sqrt: 1/d is (d^2)^-0.5 over the squared distance
+            distance_sq = self.distance_sq_from(other)
+            if distance_sq == 0:
+                return 0.0
+            return -(_G * other.mass) * distance_sq**-0.5
         if distance == 0:
             return 0.0
-        return -1 * ((SpaceTime.Gravitational_Constant * other.mass) / distance)
+        return -1 * ((_G * other.mass) / distance)
 
-    def update_position(self, dt: float):
+    def apply_forces(self, dt: float):
         """
-        Update position based on current velocity and forces.
+        Update velocity based on the accumulated net force. The position
+        update is done for all elements at once in SpaceTime.update.
         All calculations done in spherical coordinates.
         :param dt: time step in seconds
         """
-        r = self.position.r
-        sin_theta = math.sin(self.position.theta)
+        r = self.r
+        sin_theta = math.sin(self.theta)
 
         # Calculate acceleration in spherical coordinates
         # a = F / m
@@ -142,14 +237,11 @@ class Mass(_Element):
         a_theta = self._net_force.F_theta / (self._mass * r)
         a_phi = self._net_force.F_phi / (self._mass * r * sin_theta)
 
-        # Update velocity components
-        delta_v = SphericalVelocity(a_r * dt, a_theta * dt, a_phi * dt)
-        self.velocity = self.velocity + delta_v
-
-        # Update position using spherical kinematics
-        self.position.r += self.velocity.v_r * dt
-        self.position.theta += self.velocity.v_theta * dt
-        self.position.phi += self.velocity.v_phi * dt
+        # Update velocity components in place — no snapshot or delta
+        # objects, just three writes into the state arrays
+        self.v_r += a_r * dt
+        self.v_theta += a_theta * dt
+        self.v_phi += a_phi * dt
 
     def relative_time(self, absolute_dt: float) -> float:
         """
@@ -1,12 +1,23 @@
-from .mass import Mass
+import numpy as np
+
+from . import _barneshut
+from .mass import Mass, _G
+from .Coordinates.spherical_velocity import SphericalVelocity
+from .Coordinates._kernels import gravity_forces, kick_drift, kick_velocities
 
 class SpaceTime:
     """
     A model of spacetime
     Contains absolute parameters (speed of light, gravitational constant)
+
+    Simulation state is stored structure-of-arrays style: one contiguous
+    NumPy array per spherical coordinate/velocity component, shared by all
+    elements. Element objects are thin handles that index into these arrays,
+    so the per-step kinematics can be done as whole-array operations instead
+    of per-object Python attribute updates.
     """
 
-    Gravitational_Constant : float = 6.67408e-11 # m^2 kg^-1 s^-2
+    Gravitational_Constant : float = _G
     """
     The gravitational constat for this universe
     """
@@ -15,12 +26,147 @@ class SpaceTime:
     """
     The speed of light for this universe
     """
-    def __init__(self):
+
+    Barnes_Hut_Theta : float = 0.5
+    """
+    Opening angle for the Barnes-Hut far-field approximation. Smaller is
+    more accurate; 0 degenerates to direct summation.
+    """
+
+    Barnes_Hut_Threshold : int = 2048
+    """
+    Element count above which gravity switches from the O(N^2) direct
+    kernel to the O(N log N) Barnes-Hut tree.
+    """
+    def __init__(self, use_gpu: bool = False, dtype=np.float64):
         """
         Makes a new spacetime model
+        :param use_gpu: offload the pairwise gravity kernel to a CUDA
+                        device; falls back to the CPU path when no device
+                        is available.
+        :param dtype: precision of the position/velocity state arrays;
+                      a NumPy dtype, or the strings "single"/"double".
+                      np.float32 halves memory bandwidth and doubles SIMD
+                      lane count for visualization-grade runs, at the cost
+                      of ~7 significant digits; note the distance math
+                      squares r, so FP32 runs must keep r below ~1.8e19 m
+                      to avoid overflow in r^2. Ages always accumulate in
+                      FP64, and the gravity kernel sums forces and
+                      potentials in FP64 accumulators regardless of the
+                      state precision, so long runs don't lose resolution
+                      to rounding in the reductions.
         """
         self.__masses : list[Mass] = []
         self.__age : float = 0
+        if dtype == "single":
+            dtype = np.float32
+        elif dtype == "double":
+            dtype = np.float64
+        self._dtype = np.dtype(dtype)
+
+        if use_gpu:
+            from . import _gpu
+            self._gpu = _gpu if _gpu.gpu_available() else None
+        else:
+            self._gpu = None
+
+        # Structure-of-arrays element state, one slot per element. The
+        # _buf arrays carry spare capacity (doubled as needed) so adding
+        # elements is amortized O(1); the working arrays are contiguous
+        # views over the first _n slots and are re-sliced on growth.
+        self._cap = 16
+        self._n = 0
+        self._r_buf = np.zeros(self._cap, dtype=self._dtype)
+        self._theta_buf = np.zeros(self._cap, dtype=self._dtype)
+        self._phi_buf = np.zeros(self._cap, dtype=self._dtype)
+        self._v_r_buf = np.zeros(self._cap, dtype=self._dtype)
+        self._v_theta_buf = np.zeros(self._cap, dtype=self._dtype)
+        self._v_phi_buf = np.zeros(self._cap, dtype=self._dtype)
+        self._ages_buf = np.zeros(self._cap, dtype=np.float64)
+        self._m_buf = np.zeros(self._cap, dtype=np.float64)
+        self._reslice()
+
+        # Per-N scratch buffers set up by finalize(); -1 means not finalized
+        # (or invalidated by a later allocation)
+        self._scratch_n = -1
+        self._dist_sq_buf = None
+        self._dot_buf = None
+
+        # Cartesian accelerations carried across steps by the Verlet
+        # integrator; None until the first update (or after a population
+        # change) forces a fresh evaluation
+        self._ax = None
+        self._ay = None
+        self._az = None
+
+    def _reslice(self):
+        """Rebinds the working arrays as views over the first _n slots."""
+        n = self._n
+        self._r = self._r_buf[:n]
+        self._theta = self._theta_buf[:n]
+        self._phi = self._phi_buf[:n]
+        self._v_r = self._v_r_buf[:n]
+        self._v_theta = self._v_theta_buf[:n]
+        self._v_phi = self._v_phi_buf[:n]
+        self._ages = self._ages_buf[:n]
+        self._m = self._m_buf[:n]
+
+    @staticmethod
+    def _grown(buf: np.ndarray, new_cap: int) -> np.ndarray:
+        """Returns a zero-extended copy of a state buffer at new_cap."""
+        new = np.zeros(new_cap, dtype=buf.dtype)
+        new[:buf.size] = buf
+        return new
+
+    def _allocate(self, count: int = 1) -> int:
+        """
+        Reserves the given number of element state slots, doubling the
+        backing buffers when capacity runs out so a long sequence of adds
+        costs amortized O(1) copies per element rather than a full
+        reallocation of every array per add.
+        :param count: how many slots to add.
+        :return: The index of the first new slot.
+        """
+        index = self._n
+        needed = index + count
+        if needed > self._cap:
+            new_cap = max(2 * self._cap, needed)
+            self._r_buf = self._grown(self._r_buf, new_cap)
+            self._theta_buf = self._grown(self._theta_buf, new_cap)
+            self._phi_buf = self._grown(self._phi_buf, new_cap)
+            self._v_r_buf = self._grown(self._v_r_buf, new_cap)
+            self._v_theta_buf = self._grown(self._v_theta_buf, new_cap)
+            self._v_phi_buf = self._grown(self._v_phi_buf, new_cap)
+            self._ages_buf = self._grown(self._ages_buf, new_cap)
+            self._m_buf = self._grown(self._m_buf, new_cap)
+            self._cap = new_cap
+        self._n = needed
+        self._reslice()
+        self._scratch_n = -1
+        self._ax = None
+        return index
+
+    def finalize(self):
+        """
+        One-time preparation for a long run at the current element count.
+
+        Warms the compiled kernels so the first real step does not absorb
+        their specialization cost, and preallocates the (N, N) scratch
+        buffers that distance_sq_matrix / distance_matrix reuse, so
+        repeated matrix queries stop paying two N^2 allocations each
+        (update() itself never builds these matrices). Adding more masses
+        afterwards invalidates the buffers; call finalize() again once
+        the population is settled.
+        """
+        n = self._r.size
+        self._dist_sq_buf = np.empty((n, n), dtype=self._dtype)
+        self._dot_buf = np.empty((n, n), dtype=self._dtype)
+        self._scratch_n = n
+
+        # The kick kernels compile eagerly at import (pinned signatures),
+        # but gravity_forces cannot be disk-cached, so evaluate it once
+        # here to absorb its specialization cost before the run starts
+        self._compute_gravity(*self._position_trig())
 
     def add_mass(self, x: float, y: float, z: float, vx: float, vy: float, vz: float, mass: float) -> Mass:
         """
@@ -34,28 +180,265 @@ class SpaceTime:
         :param mass: the mass (in kg) of the mass.
         :return: The Mass object created.
         """
-        new_mass = Mass(x, y, z, vx, vy, vz, mass)
+        new_mass = Mass(self, self._allocate(), x, y, z, vx, vy, vz, mass)
+        self._m[new_mass.index] = mass
         self.__masses.append(new_mass)
         return new_mass
 
+    def add_masses(self, x, y, z, vx, vy, vz, mass) -> list[Mass]:
+        """
+        Bulk-adds masses to this spacetime model. All coordinate and
+        velocity conversions are done as whole-array operations, so adding
+        N masses costs a handful of ufunc calls rather than N scalar
+        conversions.
+        :param x: the x positions of the masses, shape (N,)
+        :param y: the y positions of the masses, shape (N,)
+        :param z: the z positions of the masses, shape (N,)
+        :param vx: the x velocities of the masses, shape (N,)
+        :param vy: the y velocities of the masses, shape (N,)
+        :param vz: the z velocities of the masses, shape (N,)
+        :param mass: the masses (in kg), shape (N,)
+        :return: The list of Mass objects created.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        z = np.asarray(z, dtype=np.float64)
+        vx = np.asarray(vx, dtype=np.float64)
+        vy = np.asarray(vy, dtype=np.float64)
+        vz = np.asarray(vz, dtype=np.float64)
+
+        r = np.sqrt(x * x + y * y + z * z)
+        off_origin = r > 0
+        r_safe = np.where(off_origin, r, 1.0)
+        theta = np.where(off_origin, np.arccos(np.clip(z / r_safe, -1.0, 1.0)), 0.0)
+        phi = np.where(off_origin, np.arctan2(y, x), 0.0)
+        v_r, v_theta, v_phi = SphericalVelocity.from_cartesian_batch(vx, vy, vz, r, theta, phi)
+
+        start = self._allocate(x.size)
+        new = slice(start, start + x.size)
+        self._r[new] = r
+        self._theta[new] = theta
+        self._phi[new] = phi
+        self._v_r[new] = v_r
+        self._v_theta[new] = v_theta
+        self._v_phi[new] = v_phi
+        self._m[new] = np.asarray(mass, dtype=np.float64)
+
+        new_masses = [Mass._bind(self, start + i, m) for i, m in enumerate(mass)]
+        self.__masses.extend(new_masses)
+        return new_masses
+
+    def _forces_cartesian(self):
+        """
+        Evaluates every element's net gravitational force at the current
+        positions, via the GPU kernel when one is attached or the CPU path
+        otherwise.
+        :return: (Fx, Fy, Fz, F_r, F_theta, F_phi, potentials) arrays —
+                 the Cartesian net forces, their spherical-basis
+                 projections, and the potentials.
+        """
+        sin_theta, cos_theta, sin_phi, cos_phi = self._position_trig()
+
+        if self._gpu is not None:
+            # One thread per element on the device; each handle just reads
+            # its slot of the result back
+            F_r, F_theta, F_phi, potentials = self._gpu.compute_forces(
+                self._r, self._theta, self._phi, self._m,
+                self.Gravitational_Constant)
+            # Reassemble the Cartesian net force from the spherical basis
+            # components for the velocity kick
+            Fx = (F_r * sin_theta * cos_phi + F_theta * cos_theta * cos_phi -
+                  F_phi * sin_phi)
+            Fy = (F_r * sin_theta * sin_phi + F_theta * cos_theta * sin_phi +
+                  F_phi * cos_phi)
+            Fz = F_r * cos_theta - F_theta * sin_theta
+        else:
+            Fx, Fy, Fz, potentials = self._compute_gravity(
+                sin_theta, cos_theta, sin_phi, cos_phi)
+            # Project onto the spherical basis vectors at each position so
+            # the handles' net_force property stays meaningful
+            F_r = Fx * sin_theta * cos_phi + Fy * sin_theta * sin_phi + Fz * cos_theta
+            F_theta = Fx * cos_theta * cos_phi + Fy * cos_theta * sin_phi - Fz * sin_theta
+            F_phi = -Fx * sin_phi + Fy * cos_phi
+
+        return Fx, Fy, Fz, F_r, F_theta, F_phi, potentials
+
+    def _kick(self, dt: float):
+        """
+        Applies the cached accelerations to every element's velocity for
+        the given interval. The kick is done in Cartesian — a = F / m
+        componentwise, with none of the 1/r and 1/(r sin(theta)) divisions
+        the spherical form needs — so elements passing near the poles or
+        the origin stay stable.
+        :param dt: the kick interval in seconds
+        """
+        kick_velocities(self._r, self._theta, self._phi,
+                        self._v_r, self._v_theta, self._v_phi,
+                        self._ax, self._ay, self._az, dt)
+
     def update(self, dt: float):
         """
-        Updates the simulation by one time step.
+        Updates the simulation by one time step of velocity Verlet
+        (kick-drift-kick): half a velocity kick with the accelerations
+        carried over from the previous step, a full position drift, a
+        fresh force evaluation, and the closing half kick. Kick and
+        drift both act on the Cartesian state (the spherical arrays are
+        just storage, converted exactly each way), so the composition
+        is ordinary velocity Verlet: second order, with the bounded
+        energy oscillation characteristic of the scheme, where the
+        previous Euler scheme drove close orbits to r = 0 — and still
+        one force evaluation per step. The opening kick and the drift
+        are fused into a single compiled pass over the state arrays.
         :param dt: The time step in seconds.
         """
-        # Update all gravity related potentials/forces
-        for i in range(0, len(self.__masses)):
-            current_mass = self.__masses[i]
-            other_masses = self.__masses.copy()
-            other_masses.pop(i)
-            current_mass.apply_gravity(other_masses)
+        if self._m.size:
+            if self._ax is None:
+                # First step (or the population changed): evaluate at the
+                # current positions to seed the carried accelerations
+                Fx, Fy, Fz, _, _, _, _ = self._forces_cartesian()
+                self._ax = Fx / self._m
+                self._ay = Fy / self._m
+                self._az = Fz / self._m
+
+            # Half kick plus drift, one pass over the arrays
+            kick_drift(self._r, self._theta, self._phi,
+                       self._v_r, self._v_theta, self._v_phi,
+                       self._ages, self._ax, self._ay, self._az,
+                       0.5 * dt, dt)
 
-        # Step forward in time
-        for mass in self.__masses:
-            mass.update_position(dt)
+            Fx, Fy, Fz, F_r, F_theta, F_phi, potentials = self._forces_cartesian()
+            for i, current_mass in enumerate(self.__masses):
+                current_mass._set_gravity(F_r[i], F_theta[i], F_phi[i],
+                                          potentials[i])
+            self._ax = Fx / self._m
+            self._ay = Fy / self._m
+            self._az = Fz / self._m
+            self._kick(0.5 * dt)
 
         self.__age += dt
 
+    def _position_trig(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluates sin/cos of every element's angular coordinates once.
+        :return: (sin_theta, cos_theta, sin_phi, cos_phi) arrays.
+        """
+        return np.sin(self._theta), np.cos(self._theta), np.sin(self._phi), np.cos(self._phi)
+
+    def _compute_gravity(self, sin_theta, cos_theta, sin_phi, cos_phi
+                         ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes every element's net gravitational force (Cartesian) and
+        total potential.
+
+        Below Barnes_Hut_Threshold elements the O(N^2) pair sum runs in
+        the compiled gravity_forces kernel, which parallelizes over
+        elements and accumulates in registers, so no (N, N) temporaries
+        are materialized. Above it, a Barnes-Hut octree summarizes distant
+        clusters into single sources, dropping the per-step work to
+        O(N log N) at the accuracy set by Barnes_Hut_Theta. Gravity is
+        translation-invariant, so either way the pair computation is plain
+        Cartesian arithmetic with no trig at all.
+        :param sin_theta: precomputed sin of every element's polar angle
+        :param cos_theta: precomputed cos of every element's polar angle
+        :param sin_phi: precomputed sin of every element's azimuthal angle
+        :param cos_phi: precomputed cos of every element's azimuthal angle
+        :return: (Fx, Fy, Fz, potentials) arrays, one entry per element.
+        """
+        r_sin_theta = self._r * sin_theta
+        x = r_sin_theta * cos_phi
+        y = r_sin_theta * sin_phi
+        z = self._r * cos_theta
+
+        n = self._r.size
+        Fx = np.empty(n, dtype=np.float64)
+        Fy = np.empty(n, dtype=np.float64)
+        Fz = np.empty(n, dtype=np.float64)
+        potentials = np.empty(n, dtype=np.float64)
+        if n >= self.Barnes_Hut_Threshold:
+            if _barneshut.compute_forces(x, y, z, self._m,
+                                         self.Gravitational_Constant,
+                                         self.Barnes_Hut_Theta,
+                                         Fx, Fy, Fz, potentials):
+                return Fx, Fy, Fz, potentials
+        gravity_forces(x, y, z, self._m, self.Gravitational_Constant,
+                       Fx, Fy, Fz, potentials)
+        return Fx, Fy, Fz, potentials
+
+    def cartesian_positions(self) -> np.ndarray:
+        """
+        Converts every element's spherical position to Cartesian coordinates.
+        :return: An (N, 3) array of (x, y, z) positions.
+        """
+        # Evaluate each trig array once and reuse across the x/y/z assembly
+        sin_theta, cos_theta, sin_phi, cos_phi = self._position_trig()
+        r_sin_theta = self._r * sin_theta
+        return np.column_stack([
+            r_sin_theta * cos_phi,
+            r_sin_theta * sin_phi,
+            self._r * cos_theta,
+        ])
+
+    def distance_sq_matrix(self) -> np.ndarray:
+        """
+        Computes the squared distance between every pair of elements.
+
+        Converts to Cartesian once, then applies the
+        ||p - q||^2 = ||p||^2 + ||q||^2 - 2 p.q identity so the pairwise
+        work is a single matrix product instead of per-pair trig. Since
+        positions are measured from the origin, ||p||^2 is just r^2.
+        Consumers that only need d^2 (e.g. the 1/d^2 force law) can use
+        this directly and skip the sqrt entirely.
+        :return: An (N, N) array where entry (i, j) is the squared distance
+                 between elements i and j.
+        """
+        X = self.cartesian_positions()
+        r_sq = self._r * self._r
+        if self._scratch_n == self._r.size:
+            # Reuse the finalized per-N buffers instead of allocating two
+            # fresh (N, N) arrays every step
+            dot = np.matmul(X, X.T, out=self._dot_buf)
+            dot *= 2.0
+            dist_sq = np.add(r_sq[:, None], r_sq[None, :], out=self._dist_sq_buf)
+            dist_sq -= dot
+        else:
+            dist_sq = r_sq[:, None] + r_sq[None, :] - 2.0 * (X @ X.T)
+        # Floating point error can drive near-zero entries slightly
+        # negative, and the norm identity leaves rounding residue on the
+        # diagonal where the exact answer is known
+        np.maximum(dist_sq, 0.0, out=dist_sq)
+        np.fill_diagonal(dist_sq, 0.0)
+        return dist_sq
+
+    def gravitational_potentials(self) -> np.ndarray:
+        """
+        Computes the total gravitational potential at every element's
+        position from the current state, as one vectorized pair reduction
+        over the distance matrix — no per-pair Python dispatch, and no
+        need to run a full update step first.
+        :return: An (N,) array of potentials in Joules/kg.
+        """
+        distances = self.distance_matrix()
+        np.fill_diagonal(distances, np.inf)
+        # Coincident elements contribute nothing, matching the scalar path
+        distances[distances == 0.0] = np.inf
+        return -self.Gravitational_Constant * (self._m[None, :] / distances).sum(axis=1)
+
+    def distance_matrix(self) -> np.ndarray:
+        """
+        Computes the distance between every pair of elements.
+        :return: An (N, N) array where entry (i, j) is the distance between
+                 elements i and j.
+        """
+        dist_sq = self.distance_sq_matrix()
+        return np.sqrt(dist_sq, out=dist_sq)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        :return: The precision of the position/velocity state arrays.
+        """
+        return self._dtype
+
     @property
     def masses(self) -> list[Mass]:
         """
@@ -69,3 +452,52 @@ class SpaceTime:
         :return: The age of this spacetime in seconds.
         """
         return self.__age
+
+    @property
+    def r(self) -> np.ndarray:
+        """
+        :return: The radial coordinates of every element.
+        """
+        return self._r
+
+    @property
+    def theta(self) -> np.ndarray:
+        """
+        :return: The polar angles of every element.
+        """
+        return self._theta
+
+    @property
+    def phi(self) -> np.ndarray:
+        """
+        :return: The azimuthal angles of every element.
+        """
+        return self._phi
+
+    @property
+    def v_r(self) -> np.ndarray:
+        """
+        :return: The radial velocities of every element.
+        """
+        return self._v_r
+
+    @property
+    def v_theta(self) -> np.ndarray:
+        """
+        :return: The polar angular velocities of every element.
+        """
+        return self._v_theta
+
+    @property
+    def v_phi(self) -> np.ndarray:
+        """
+        :return: The azimuthal angular velocities of every element.
+        """
+        return self._v_phi
+
+    @property
+    def ages(self) -> np.ndarray:
+        """
+        :return: The ages of every element in seconds.
+        """
+        return self._ages